@@ -11,7 +11,10 @@ __version__ = "0.1.0"
 
 
 def convert(
-    input_dir: str | Path, output_dir: str | Path, config: Optional[str | Path] = None
+    input_dir: str | Path,
+    output_dir: str | Path,
+    config: Optional[str | Path] = None,
+    jobs: Optional[int] = None,
 ) -> None:
     """
     Convert documents to a MkDocs site.
@@ -20,10 +23,11 @@ def convert(
         input_dir: Directory containing input documents
         output_dir: Directory where the MkDocs site will be generated
         config: Optional path to custom MkDocs configuration
+        jobs: Number of worker processes; 1 converts serially
     """
     input_path = Path(input_dir)
     output_path = Path(output_dir)
     config_path = Path(config) if config else None
 
-    converter = Converter(input_path, output_path, config_path)
+    converter = Converter(input_path, output_path, config_path, jobs=jobs)
     converter.convert()
@@ -25,14 +25,25 @@ def cli():
     type=click.Path(exists=True, dir_okay=False),
     help="Custom MkDocs configuration file",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes (1 converts serially; default: all cores)",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 def convert(
-    input_dir: str, output_dir: str, config: str | None = None, verbose: bool = False
+    input_dir: str,
+    output_dir: str,
+    config: str | None = None,
+    jobs: int | None = None,
+    verbose: bool = False,
 ):
     """Convert documents from INPUT_DIR to OUTPUT_DIR."""
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
-    convert_docs(input_dir, output_dir, config)
+    convert_docs(input_dir, output_dir, config, jobs=jobs)
 
 
 @cli.command()
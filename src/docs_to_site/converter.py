@@ -2,29 +2,47 @@
 Main document conversion orchestration.
 """
 import logging
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, List, Tuple, Dict
 
-from .document_converter import DocumentConverter
+from .document_converter import (
+    DocumentConverter,
+    convert_single_document,
+    init_worker,
+    markdown_output_path,
+)
 from .mkdocs_config import MkDocsConfig
+from .utils import hash_file, sanitize_title
 
 logger = logging.getLogger(__name__)
 
 class Converter:
     """Main converter class that orchestrates the document conversion process."""
     
-    def __init__(self, input_dir: Path, output_dir: Path, config: Optional[Path] = None):
+    def __init__(
+        self,
+        input_dir: Path,
+        output_dir: Path,
+        config: Optional[Path] = None,
+        jobs: Optional[int] = None,
+    ):
         """
         Initialize the converter.
-        
+
         Args:
             input_dir: Directory containing input documents
             output_dir: Directory where the MkDocs site will be generated
             config: Optional path to custom MkDocs configuration
+            jobs: Number of worker processes; 1 converts serially in-process
+                (useful for debugging), None uses all cores
         """
         self.input_dir = input_dir
         self.output_dir = output_dir
         self.config = config
+        self.jobs = jobs
         
         # Initialize components
         self.document_converter = DocumentConverter(input_dir, output_dir)
@@ -44,7 +62,7 @@ class Converter:
             ValueError: If no supported documents are found
             OSError: If there are file system related errors
         """
-        logger.info(f"Starting document conversion from {self.input_dir} to {self.output_dir}")
+        logger.info("Starting document conversion from %s to %s", self.input_dir, self.output_dir)
         
         try:
             # Get all documents
@@ -54,20 +72,51 @@ class Converter:
             
             self.total = len(documents)
             
-            # Convert documents
+            # Prefilter inaccessible files so workers never touch locked files
+            accessible_docs = []
             for doc, is_accessible in documents:
-                if not is_accessible:
+                if is_accessible:
+                    accessible_docs.append(doc)
+                else:
                     self.inaccessible_files.append(doc)
-                    continue
-                
-                try:
-                    self.document_converter.convert_document(doc)
-                    self.succeeded += 1
-                except (PermissionError, OSError):
-                    self.inaccessible_files.append(doc)
-                except Exception as e:
-                    logger.error(f"Failed to convert {doc}: {str(e)}")
-                    self.conversion_errors.append((doc, str(e)))
+
+            # Group identical files so each unique payload is converted once
+            unique_docs, duplicate_of = self._group_duplicates(accessible_docs)
+
+            # Convert documents in parallel - parsing is CPU-bound and
+            # independent per file, so fan out across all cores
+            converted: Dict[Path, Tuple[Path, str]] = {}
+            docs_dir = self.document_converter.docs_dir
+            if unique_docs and self.jobs == 1:
+                # Serial fallback: easier to debug and profile
+                for doc in unique_docs:
+                    self._record_conversion(
+                        doc,
+                        lambda d=doc: convert_single_document(
+                            d, self.input_dir, docs_dir
+                        ),
+                        converted,
+                    )
+            elif unique_docs:
+                with ProcessPoolExecutor(
+                    max_workers=self.jobs or os.cpu_count(), initializer=init_worker
+                ) as executor:
+                    futures = {
+                        executor.submit(
+                            convert_single_document,
+                            doc,
+                            self.input_dir,
+                            docs_dir,
+                        ): doc
+                        for doc in unique_docs
+                    }
+                    for future in as_completed(futures):
+                        self._record_conversion(
+                            futures[future], future.result, converted
+                        )
+
+            # Reuse converted output for byte-identical duplicates
+            self._link_duplicates(duplicate_of, converted)
             
             # Generate MkDocs configuration
             self.mkdocs.generate(self.document_converter.converted_files)
@@ -79,25 +128,150 @@ class Converter:
             # Ensure cleanup is called even if conversion fails
             self.cleanup()
     
+    def _record_conversion(self, doc, result_fn, converted) -> None:
+        """
+        Record the outcome of one conversion, successful or not.
+
+        Args:
+            doc: Source document the result belongs to
+            result_fn: Callable returning (relative output, title) or raising
+            converted: Mapping of document to result, updated on success
+        """
+        try:
+            relative_output, title = result_fn()
+            converted[doc] = (relative_output, title)
+            self.document_converter.converted_files[relative_output] = title
+            self.succeeded += 1
+        except (PermissionError, OSError):
+            self.inaccessible_files.append(doc)
+        except Exception as e:
+            logger.error("Failed to convert %s: %s", doc, e)
+            self.conversion_errors.append((doc, str(e)))
+
+    def _group_duplicates(
+        self, documents: List[Path]
+    ) -> Tuple[List[Path], Dict[Path, Path]]:
+        """
+        Group byte-identical documents so only one representative is converted.
+
+        Files are bucketed by size first so hashing is only paid for
+        same-size candidates.
+
+        Args:
+            documents: Accessible documents to group
+
+        Returns:
+            Tuple of (unique documents to convert, mapping of duplicate
+            document to its representative)
+        """
+        by_size: Dict[int, List[Path]] = {}
+        for doc in documents:
+            try:
+                size = doc.stat().st_size
+            except OSError:
+                size = -1
+            by_size.setdefault(size, []).append(doc)
+
+        unique_docs: List[Path] = []
+        duplicate_of: Dict[Path, Path] = {}
+        for same_size in by_size.values():
+            if len(same_size) == 1:
+                unique_docs.append(same_size[0])
+                continue
+            by_hash: Dict[str, Path] = {}
+            for doc in same_size:
+                try:
+                    digest = hash_file(doc)
+                except OSError:
+                    unique_docs.append(doc)
+                    continue
+                if digest in by_hash:
+                    duplicate_of[doc] = by_hash[digest]
+                    logger.info("%s is identical to %s", doc, by_hash[digest])
+                else:
+                    by_hash[digest] = doc
+                    unique_docs.append(doc)
+
+        return unique_docs, duplicate_of
+
+    def _link_duplicates(
+        self,
+        duplicate_of: Dict[Path, Path],
+        converted: Dict[Path, Tuple[Path, str]],
+    ) -> None:
+        """
+        Produce output for duplicate documents from their representatives.
+
+        Byte-reuse is only correct when the duplicate's page would come out
+        byte-identical anyway: the representative's H1 header is baked into
+        its markdown, and image references are relative to its output
+        directory. Duplicates with a different title or a different output
+        directory are converted like any other document instead.
+
+        Args:
+            duplicate_of: Mapping of duplicate document to its representative
+            converted: Mapping of representative to (relative output, title)
+        """
+        docs_dir = self.document_converter.docs_dir
+        for duplicate, representative in duplicate_of.items():
+            if representative not in converted:
+                # The representative failed; report the duplicate alongside it
+                self.conversion_errors.append(
+                    (duplicate, f"identical to {representative}, which failed to convert")
+                )
+                continue
+
+            relative_output, rep_title = converted[representative]
+            source = docs_dir / relative_output
+            target = markdown_output_path(duplicate, self.input_dir, docs_dir)
+            if (
+                target.parent != source.parent
+                or sanitize_title(duplicate.stem) != rep_title
+            ):
+                self._record_conversion(
+                    duplicate,
+                    lambda d=duplicate: convert_single_document(
+                        d, self.input_dir, docs_dir
+                    ),
+                    converted,
+                )
+                continue
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                if target.exists():
+                    target.unlink()
+                try:
+                    os.link(source, target)
+                except OSError:
+                    shutil.copyfile(source, target)
+                self.document_converter.converted_files[
+                    target.relative_to(docs_dir)
+                ] = rep_title
+                self.succeeded += 1
+            except OSError as e:
+                logger.error("Failed to reuse output for %s: %s", duplicate, e)
+                self.conversion_errors.append((duplicate, str(e)))
+
     def _report_summary(self) -> None:
         """Report the conversion summary to the logger."""
         failed = len(self.conversion_errors)
         inaccessible = len(self.inaccessible_files)
         
         logger.info("Document conversion complete:")
-        logger.info(f"- Successfully converted: {self.succeeded}/{self.total} documents")
+        logger.info("- Successfully converted: %s/%s documents", self.succeeded, self.total)
         
         if self.inaccessible_files:
             logger.warning(
                 "The following files could not be accessed (they may be open in another program):"
             )
             for doc in self.inaccessible_files:
-                logger.warning(f"- {doc}")
+                logger.warning("- %s", doc)
                 
         if self.conversion_errors:
             logger.warning("The following documents failed to convert:")
             for doc, error in self.conversion_errors:
-                logger.warning(f"- {doc}: {error}")
+                logger.warning("- %s: %s", doc, error)
     
     def cleanup(self) -> None:
         """Clean up resources used by the converter."""
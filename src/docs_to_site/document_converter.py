@@ -2,17 +2,389 @@
 Core document conversion functionality.
 """
 
+import hashlib
+import json
 import logging
+import os
+import shutil
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
-from markitdown import MarkItDown, UnsupportedFormatException, FileConversionException
+if TYPE_CHECKING:
+    from markitdown import MarkItDown
 
-from .utils import sanitize_filename, sanitize_title, SUPPORTED_FORMATS
+from .utils import (
+    format_markdown,
+    hash_file,
+    sanitize_filename,
+    sanitize_title,
+    IMAGE_FORMATS,
+    SUPPORTED_FORMATS,
+)
 from .processors.factory import ProcessorFactory
 
 logger = logging.getLogger(__name__)
 
+# Directory (under the output dir) holding cached conversion results
+CACHE_DIR_NAME = ".d2s-cache"
+
+# Version tag mixed into cache keys so cached markdown is invalidated when the
+# underlying converter changes
+try:
+    _CACHE_TAG = f"markitdown-{metadata.version('markitdown')}"
+except metadata.PackageNotFoundError:  # pragma: no cover
+    _CACHE_TAG = "markitdown-unknown"
+
+
+# Shared per-process MarkItDown instance - constructing one loads plugins,
+# so each worker should pay that cost exactly once
+_markitdown: Optional["MarkItDown"] = None
+
+
+def _get_markitdown() -> "MarkItDown":
+    """Return the per-process MarkItDown instance, creating it on first use."""
+    global _markitdown
+    if _markitdown is None:
+        # Imported here so the CLI does not pay the markitdown import
+        # (its converter stack is the heaviest dependency) at startup
+        from markitdown import MarkItDown
+
+        _markitdown = MarkItDown()
+    return _markitdown
+
+
+def init_worker() -> None:
+    """Warm the shared MarkItDown instance at worker-process startup."""
+    _get_markitdown()
+
+
+# Directories already created by this process - lets us skip the stat that
+# mkdir(exist_ok=True) performs for every file sharing a parent
+_ensured_dirs: set = set()
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Create a directory once per process, skipping repeated mkdir calls.
+
+    Cache hits are revalidated with a single stat: a long-lived process
+    (the Tkinter UI) may outlive a directory it created if the user
+    deletes the output tree between runs.
+    """
+    if directory in _ensured_dirs and directory.is_dir():
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(directory)
+
+
+def _read_title(markdown_path: Path) -> str:
+    """Read the title back from a previously written markdown file."""
+    with open(markdown_path, "r", encoding="utf-8") as f:
+        first_line = f.readline().strip()
+    if first_line.startswith("# "):
+        return first_line[2:]
+    return markdown_path.stem
+
+
+def _content_hash(document: Path, relative_parent: Path) -> str:
+    """Hash a document's contents together with the converter version tag.
+
+    The stem and the output-relative parent directory participate in the
+    key: title-less formats derive their H1 header from the stem, and image
+    references are baked into the markdown relative to its output
+    directory, so the same bytes under a different name or directory must
+    not share a cached page.
+    """
+    digest = hashlib.blake2b(_CACHE_TAG.encode("utf-8"), digest_size=16)
+    digest.update(str(relative_parent).encode("utf-8"))
+    digest.update(document.stem.encode("utf-8"))
+    digest.update(hash_file(document).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _iter_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield file entries under a directory.
+
+    Uses os.scandir so the file/directory distinction comes from the
+    DirEntry's cached stat instead of a second syscall per path.
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _iter_files(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+                except OSError:
+                    continue
+    except PermissionError:
+        logger.warning("Cannot scan directory %s: permission denied", root)
+
+
+def markdown_output_path(document: Path, input_dir: Path, docs_dir: Path) -> Path:
+    """
+    Compute the output markdown path for a document.
+
+    Args:
+        document: Path to the input document
+        input_dir: Directory containing input documents
+        docs_dir: Directory where Markdown files are written
+
+    Returns:
+        Path of the markdown file the document converts to
+    """
+    relative_path = document.relative_to(input_dir)
+    # Sanitize the filename part while keeping the directory structure
+    sanitized_name = sanitize_filename(relative_path.stem) + ".md"
+    return docs_dir / relative_path.parent / sanitized_name
+
+
+def extract_pptx_images(document: Path, doc_images_dir: Path) -> Dict[str, str]:
+    """
+    Extract embedded images from a PPTX presentation.
+
+    Reads picture blobs straight out of the .pptx ZIP container instead of
+    parsing the full presentation object model, so memory stays bounded at
+    one image at a time.
+
+    Args:
+        document: Path to the .pptx file
+        doc_images_dir: Directory where extracted images are written
+
+    Returns:
+        Dictionary mapping original media filenames to extracted filenames
+    """
+    image_map: Dict[str, str] = {}
+    try:
+        with zipfile.ZipFile(document) as archive:
+            media_infos = [
+                info
+                for info in archive.infolist()
+                if info.filename.startswith("ppt/media/")
+                and os.path.splitext(info.filename)[1].lower() in IMAGE_FORMATS
+            ]
+            if not media_infos:
+                return image_map
+
+            _ensure_dir(doc_images_dir)
+            # Byte-identical blobs stored under several media names are
+            # extracted once; the ZIP directory already carries a CRC and
+            # size per entry, so duplicate detection costs no extra reads
+            seen_blobs: Dict[Tuple[int, int, str], str] = {}
+            index = 0
+            for info in media_infos:
+                name = info.filename
+                suffix = Path(name).suffix.lower()
+                blob_key = (info.CRC, info.file_size, suffix)
+                extracted = seen_blobs.get(blob_key)
+                if extracted is None:
+                    index += 1
+                    extracted = f"image_{index}{suffix}"
+                    target = doc_images_dir / extracted
+                    with archive.open(info) as source, open(target, "wb") as dest:
+                        shutil.copyfileobj(source, dest, 64 * 1024)
+                    seen_blobs[blob_key] = extracted
+                image_map[Path(name).name] = extracted
+    except (zipfile.BadZipFile, KeyError, OSError) as e:
+        logger.warning("Failed to extract images from %s: %s", document, e)
+
+    return image_map
+
+
+def copy_embedded_images(doc_dir: Path, output_dir: Path, content: str) -> int:
+    """
+    Copy referenced sibling images next to the converted markdown.
+
+    HTML (and similar) sources often reference image files that live beside
+    them in the input tree; the converted markdown keeps those relative
+    references, so the files must follow it into the docs tree. One scandir
+    sweep finds every candidate instead of one glob per extension.
+
+    Args:
+        doc_dir: Directory containing the source document
+        output_dir: Directory containing the converted markdown
+        content: Converted markdown content, used to skip unreferenced files
+
+    Returns:
+        Number of images copied
+    """
+    copied = 0
+    with os.scandir(doc_dir) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            suffix = os.path.splitext(entry.name)[1].lower()
+            if suffix not in IMAGE_FORMATS or entry.name not in content:
+                continue
+            target = output_dir / entry.name
+            _ensure_dir(output_dir)
+            with open(entry.path, "rb") as source, open(target, "wb") as dest:
+                shutil.copyfileobj(source, dest, 1 << 20)
+            copied += 1
+    return copied
+
+
+def convert_single_document(
+    document: Path, input_dir: Path, docs_dir: Path
+) -> Tuple[Path, str]:
+    """
+    Convert a single document to Markdown.
+
+    This is a module-level function so it can be pickled and executed in a
+    worker process by ``concurrent.futures.ProcessPoolExecutor``.
+
+    Args:
+        document: Path to the document to convert
+        input_dir: Directory containing input documents
+        docs_dir: Directory where Markdown files are written
+
+    Returns:
+        Tuple of (output path relative to docs_dir, document title)
+
+    Raises:
+        FileConversionException: If the file cannot be converted
+        PermissionError: If the file cannot be accessed
+        OSError: If there are file system related errors
+    """
+    output_path = markdown_output_path(document, input_dir, docs_dir)
+
+    # Incremental-rebuild gate: an output at least as new as the input is
+    # still valid, so skip conversion (and hashing) with two stat calls
+    try:
+        output_stat = output_path.stat()
+        if (
+            output_stat.st_size > 0
+            and output_stat.st_mtime_ns >= document.stat().st_mtime_ns
+        ):
+            logger.info("Skipping %s: output is up to date", document)
+            return output_path.relative_to(docs_dir), _read_title(output_path)
+    except OSError:
+        pass
+
+    _ensure_dir(output_path.parent)
+
+    logger.info("Converting %s to %s", document, output_path)
+
+    # Reuse a cached conversion of identical content if one exists - this
+    # path never needs MarkItDown, so the import below is not paid for it
+    cache_dir = docs_dir.parent / CACHE_DIR_NAME
+    content_hash = _content_hash(document, document.relative_to(input_dir).parent)
+    cached_md = cache_dir / f"{content_hash}.md"
+    cached_meta = cache_dir / f"{content_hash}.json"
+    if cached_md.exists() and cached_meta.exists():
+        with open(cached_meta, "r", encoding="utf-8") as f:
+            title = json.load(f)["title"]
+        tmp_path = output_path.with_name(f"{output_path.name}.tmp{os.getpid()}")
+        shutil.copyfile(cached_md, tmp_path)
+        os.replace(tmp_path, output_path)
+        # The cached markdown's references are already rewritten for this
+        # output path, but the image files they point to may be missing
+        # (fresh docs tree, cache carried over from an earlier run) - so
+        # the per-output side effects still run on a hit
+        doc_suffix = document.suffix.lower()
+        if doc_suffix == ".pptx":
+            extract_pptx_images(
+                document, docs_dir / "images" / sanitize_filename(document.stem)
+            )
+        elif doc_suffix in {".html", ".htm"}:
+            with open(output_path, "r", encoding="utf-8") as f:
+                copy_embedded_images(document.parent, output_path.parent, f.read())
+        logger.info("Reused cached conversion for %s", document)
+        return output_path.relative_to(docs_dir), title
+
+    converter = _get_markitdown()
+    from markitdown import FileConversionException, UnsupportedFormatException
+
+    processor_factory = ProcessorFactory()
+    try:
+        # Convert document to Markdown using MarkItDown
+        result = converter.convert_local(str(document))
+
+        # Get the title and content
+        title = getattr(result, "title", None)
+        if not title:
+            # Use the filename without extension as title if no title is found
+            title = document.stem
+        title = sanitize_title(title)
+
+        # Keep the title header as a separate chunk: the formatting passes
+        # only need to see the converted body, so the header is never
+        # rescanned or re-copied by the regex pipeline
+        header = f"# {title}\n\n" if title else ""
+        body = result.text_content
+
+        # Extract embedded images so their references can be rewritten to
+        # the extracted locations
+        image_map: Dict[str, str] = {}
+        if document.suffix.lower() == ".pptx":
+            doc_images_dir = docs_dir / "images" / sanitize_filename(document.stem)
+            extracted = extract_pptx_images(document, doc_images_dir)
+            for original_name, extracted_name in extracted.items():
+                relative_image = os.path.relpath(
+                    doc_images_dir / extracted_name, output_path.parent
+                )
+                image_map[original_name] = relative_image.replace(os.sep, "/")
+
+        # Apply post-processing
+        processors = processor_factory.get_processors(document)
+        for processor in processors:
+            body = processor.process(
+                body, metadata=getattr(result, "metadata", None)
+            )
+        if image_map:
+            body = format_markdown(body, image_map=image_map)
+
+        # HTML sources keep relative references to images beside them, so
+        # bring the referenced files along into the docs tree
+        if document.suffix.lower() in {".html", ".htm"}:
+            copy_embedded_images(document.parent, output_path.parent, body)
+
+        # Encode each chunk once and write the raw bytes sequentially -
+        # avoids both the header+body string concatenation and
+        # TextIOWrapper's incremental encoder on multi-MB outputs. The
+        # write goes through a temp file and os.replace so a crash cannot
+        # leave a truncated output that the freshness gate above would
+        # treat as valid, and so hard-linked duplicate outputs are
+        # relinked rather than overwritten through the shared inode.
+        header_bytes = header.encode("utf-8")
+        body_bytes = body.encode("utf-8")
+        tmp_path = output_path.with_name(f"{output_path.name}.tmp{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            f.write(header_bytes)
+            f.write(body_bytes)
+        os.replace(tmp_path, output_path)
+
+        # Populate the cache atomically so concurrent workers cannot observe
+        # a partially written entry
+        try:
+            _ensure_dir(cache_dir)
+            tmp_suffix = f".tmp{os.getpid()}"
+            tmp_md = cache_dir / f"{content_hash}.md{tmp_suffix}"
+            tmp_meta = cache_dir / f"{content_hash}.json{tmp_suffix}"
+            with open(tmp_md, "wb") as f:
+                f.write(header_bytes)
+                f.write(body_bytes)
+            with open(tmp_meta, "w", encoding="utf-8") as f:
+                json.dump({"title": title}, f)
+            os.replace(tmp_md, cached_md)
+            os.replace(tmp_meta, cached_meta)
+        except OSError as e:
+            logger.warning("Failed to cache conversion for %s: %s", document, e)
+
+        return output_path.relative_to(docs_dir), title
+
+    except (UnsupportedFormatException, FileConversionException) as e:
+        logger.error("Failed to convert %s: %s", document, e)
+        raise
+    finally:
+        processor_factory.cleanup()
+
 
 class DocumentConverter:
     """Handles the conversion of documents to Markdown and MkDocs site generation."""
@@ -29,8 +401,7 @@ class DocumentConverter:
         self.output_dir = output_dir
         self.docs_dir = output_dir / "docs"
         self.images_dir = self.docs_dir / "images"
-        self.converter = MarkItDown()
-        self.processor_factory = ProcessorFactory()
+        self.cache_dir = output_dir / CACHE_DIR_NAME
         self.converted_files: Dict[Path, str] = {}  # Maps output paths to titles
 
     def is_supported_format(self, file_path: Path) -> bool:
@@ -44,25 +415,45 @@ class DocumentConverter:
         Returns:
             List of tuples containing (file_path, is_accessible)
         """
+        candidates = []
+        for entry in _iter_files(str(self.input_dir)):
+            # Check the suffix on the raw name so rejected files never pay
+            # for a Path object
+            suffix = os.path.splitext(entry.name)[1].lower()
+            if suffix in SUPPORTED_FORMATS:
+                candidates.append(entry.path)
+
+        # Probe accessibility with a single syscall per file instead of
+        # opening it and reading a byte. os.access releases the GIL, so on
+        # network filesystems the probes overlap in a thread pool instead
+        # of serializing one round trip per file.
+        if len(candidates) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(32, len(candidates))
+            ) as pool:
+                accessible = list(
+                    pool.map(lambda path: os.access(path, os.R_OK), candidates)
+                )
+        else:
+            accessible = [os.access(path, os.R_OK) for path in candidates]
+
         documents = []
-        for file in self.input_dir.rglob("*"):
-            if file.is_file() and self.is_supported_format(file):
-                # Check if file is accessible
-                try:
-                    with open(file, "rb") as f:
-                        f.read(1)
-                    documents.append((file, True))
-                    logger.info(f"Found supported document: {file}")
-                except (PermissionError, OSError):
-                    logger.warning(
-                        f"File {file} exists but cannot be accessed. It may be open in another program."
-                    )
-                    documents.append((file, False))
-
-        logger.info(f"Found {len(documents)} supported documents")
+        for path, is_accessible in zip(candidates, accessible):
+            file = Path(path)
+            if is_accessible:
+                logger.info("Found supported document: %s", file)
+            else:
+                logger.warning(
+                    "File %s exists but cannot be accessed. It may be open in another program.",
+                    file,
+                )
+            documents.append((file, is_accessible))
+
+        logger.info("Found %s supported documents", len(documents))
         if not documents:
             logger.warning(
-                f"No supported documents found. Supported formats are: {', '.join(sorted(SUPPORTED_FORMATS))}"
+                "No supported documents found. Supported formats are: %s",
+                ", ".join(sorted(SUPPORTED_FORMATS)),
             )
         return documents
 
@@ -81,56 +472,18 @@ class DocumentConverter:
             PermissionError: If the file cannot be accessed
             OSError: If there are file system related errors
         """
-        relative_path = document.relative_to(self.input_dir)
-        # Sanitize the filename part while keeping the directory structure
-        sanitized_name = sanitize_filename(relative_path.stem) + ".md"
-        sanitized_path = relative_path.parent / sanitized_name
-        output_path = self.docs_dir / sanitized_path
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        logger.info(f"Converting {document} to {output_path}")
-        try:
-            # First check if we can access the file
-            with open(document, "rb") as f:
-                f.read(1)
-
-            # Convert document to Markdown using MarkItDown
-            result = self.converter.convert_local(str(document))
-
-            # Get the title and content
-            title = getattr(result, "title", None)
-            if not title:
-                # Use the filename without extension as title if no title is found
-                title = document.stem
-            title = sanitize_title(title)
-
-            content = result.text_content
-
-            # If we have a title, add it as a header
-            markdown_content = f"# {title}\n\n" if title else ""
-            markdown_content += content
-
-            # Apply post-processing
-            processors = self.processor_factory.get_processors(document)
-            for processor in processors:
-                markdown_content = processor.process(
-                    markdown_content, metadata=getattr(result, "metadata", None)
-                )
+        relative_output, title = convert_single_document(
+            document, self.input_dir, self.docs_dir
+        )
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
+        # Store the title for navigation
+        self.converted_files[relative_output] = title
 
-            # Store the title for navigation
-            relative_output = output_path.relative_to(self.docs_dir)
-            self.converted_files[relative_output] = title
-
-            return output_path
-
-        except (UnsupportedFormatException, FileConversionException) as e:
-            logger.error(f"Failed to convert {document}: {str(e)}")
-            raise
+        return self.docs_dir / relative_output
 
     def cleanup(self) -> None:
-        """Cleanup resources used by the converter."""
-        self.processor_factory.cleanup()
+        """Cleanup resources used by the converter.
+
+        Conversion workers own and clean up their converter state, so there
+        is nothing to release here; kept for interface stability.
+        """
@@ -4,14 +4,31 @@ MkDocs configuration and navigation structure generation.
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-import yaml
+from typing import Any, Dict, List, Optional
 
 from .utils import sanitize_title
 
 logger = logging.getLogger(__name__)
 
+
+def _yaml():
+    """
+    Import yaml lazily, preferring the LibYAML loader/dumper.
+
+    Returns:
+        Tuple of (yaml module, loader class, dumper class)
+    """
+    import yaml
+
+    try:
+        # LibYAML-backed loader/dumper - an order of magnitude faster on
+        # large nav trees when the C extension is available
+        from yaml import CSafeDumper as Dumper, CSafeLoader as Loader
+    except ImportError:  # pragma: no cover
+        from yaml import SafeDumper as Dumper, SafeLoader as Loader
+
+    return yaml, Loader, Dumper
+
 class MkDocsConfig:
     """Handles MkDocs configuration generation and management."""
     
@@ -34,12 +51,13 @@ class MkDocsConfig:
         if not self.custom_config:
             return
             
+        yaml, loader, _ = _yaml()
         try:
             with open(self.custom_config, 'r', encoding='utf-8') as f:
-                self.config_data = yaml.safe_load(f)
-            logger.info(f"Loaded custom configuration from {self.custom_config}")
+                self.config_data = yaml.load(f, Loader=loader)
+            logger.info("Loaded custom configuration from %s", self.custom_config)
         except Exception as e:
-            logger.warning(f"Failed to load custom config {self.custom_config}: {str(e)}")
+            logger.warning("Failed to load custom config %s: %s", self.custom_config, e)
             self._generate_default_config()
     
     def _generate_default_config(self) -> None:
@@ -85,55 +103,39 @@ class MkDocsConfig:
         Returns:
             List of navigation items in MkDocs format
         """
-        # Create a nested dictionary for the navigation
+        # Build the nested structure in one pass, sanitizing each prefix and
+        # title exactly once
         nav_structure: Dict[str, Any] = {}
-        
-        # Group files by common prefixes
-        prefix_groups: Dict[str, List[Tuple[Path, str]]] = {}
         for file_path, title in converted_files.items():
             # Extract prefix (e.g., "Client" from "Client - Guide")
-            parts = title.split(" - ", 1)
-            prefix = parts[0] if len(parts) > 1 else ""
-            if prefix:
-                if prefix not in prefix_groups:
-                    prefix_groups[prefix] = []
-                prefix_groups[prefix].append((file_path, title))
+            prefix, sep, remainder = title.partition(" - ")
+            file_path_str = str(file_path).replace('\\', '/')
+            if sep and prefix:
+                clean_prefix = sanitize_title(prefix)
+                group = nav_structure.get(clean_prefix)
+                if not isinstance(group, dict):
+                    # A direct entry may already sit under this name; the
+                    # group wins, whichever order the results arrived in
+                    group = {}
+                    nav_structure[clean_prefix] = group
+                group[sanitize_title(remainder)] = file_path_str
             else:
-                # Files without a prefix go directly into nav_structure
+                # Files without a prefix go directly into nav_structure,
+                # unless a group already claimed the name - groups win
                 clean_title = sanitize_title(title)
-                file_path_str = str(file_path).replace('\\', '/')
-                nav_structure[clean_title] = file_path_str
-        
-        # Process grouped files
-        for prefix, files in prefix_groups.items():
-            clean_prefix = sanitize_title(prefix)
-            prefix_nav: Dict[str, Any] = {}
-            
-            for file_path, title in files:
-                # Get the part after the prefix
-                title_parts = title.split(" - ", 1)
-                clean_title = sanitize_title(title_parts[1] if len(title_parts) > 1 else title)
-                file_path_str = str(file_path).replace('\\', '/')
-                prefix_nav[clean_title] = file_path_str
-            
-            nav_structure[clean_prefix] = prefix_nav
-        
-        # Convert the nested dictionary to MkDocs nav format
-        def dict_to_nav(d: Dict[str, Any]) -> List[Any]:
-            nav = []
-            # Sort items to ensure consistent ordering
-            for k, v in sorted(d.items()):
-                if isinstance(v, str):
-                    nav.append({k: v})
-                else:
-                    # Handle nested sections
-                    if isinstance(v, dict):
-                        subnav = dict_to_nav(v)
-                        if subnav:  # Only add non-empty sections
-                            nav.append({k: subnav})
-            return nav
-        
-        return dict_to_nav(nav_structure)
+                if not isinstance(nav_structure.get(clean_title), dict):
+                    nav_structure[clean_title] = file_path_str
+
+        return self._dict_to_nav(nav_structure)
+
+    def _dict_to_nav(self, structure: Dict[str, Any]) -> List[Any]:
+        """Convert a nested dictionary to the MkDocs nav list format."""
+        # Sort items to ensure consistent ordering; skip empty sections
+        return [
+            {key: (value if isinstance(value, str) else self._dict_to_nav(value))}
+            for key, value in sorted(structure.items())
+            if isinstance(value, str) or value
+        ]
     
     def generate(self, converted_files: Dict[Path, str]) -> None:
         """
@@ -157,17 +159,19 @@ class MkDocsConfig:
         
         # Write config file
         config_path = self.output_dir / 'mkdocs.yml'
+        yaml, _, dumper = _yaml()
         try:
             with open(config_path, 'w', encoding='utf-8') as f:
                 yaml.dump(
                     self.config_data,
                     f,
+                    Dumper=dumper,
                     default_flow_style=False,
                     sort_keys=False,
                     allow_unicode=True,
                     encoding='utf-8'
                 )
-            logger.info(f"Generated MkDocs configuration at {config_path}")
+            logger.info("Generated MkDocs configuration at %s", config_path)
         except Exception as e:
-            logger.error(f"Failed to write MkDocs configuration: {str(e)}")
+            logger.error("Failed to write MkDocs configuration: %s", e)
             raise
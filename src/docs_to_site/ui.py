@@ -220,19 +220,19 @@ class ConverterUI:
                 self.current_file_var.set(f"Converting: {doc.name}")
                 
                 if not is_accessible:
-                    logger.warning(f"Cannot access: {doc.name}")
+                    logger.warning("Cannot access: %s", doc.name)
                     self.converter.inaccessible_files.append(doc)
                     continue
                 
                 try:
                     self.converter.document_converter.convert_document(doc)
                     self.converter.succeeded += 1
-                    logger.info(f"Successfully converted: {doc.name}")
+                    logger.info("Successfully converted: %s", doc.name)
                 except (PermissionError, OSError):
-                    logger.warning(f"Cannot access: {doc.name}")
+                    logger.warning("Cannot access: %s", doc.name)
                     self.converter.inaccessible_files.append(doc)
                 except Exception as e:
-                    logger.error(f"Failed to convert {doc.name}: {str(e)}")
+                    logger.error("Failed to convert %s: %s", doc.name, e)
                     self.converter.conversion_errors.append((doc, str(e)))
                 
                 self._update_stats()
@@ -246,7 +246,7 @@ class ConverterUI:
                 self._show_completion_message()
         
         except Exception as e:
-            logger.error(f"Error: {str(e)}")
+            logger.error("Error: %s", e)
             messagebox.showerror("Error", f"Conversion failed: {str(e)}")
         
         finally:
@@ -325,7 +325,7 @@ class ConverterUI:
         try:
             folder_path.mkdir(parents=True, exist_ok=True)
         except Exception as e:
-            logger.error(f"Failed to create output folder: {e}")
+            logger.error("Failed to create output folder: %s", e)
             messagebox.showerror(
                 "Error",
                 f"Could not create the output folder:\n{folder_path}\n\n{str(e)}"
@@ -345,9 +345,9 @@ class ConverterUI:
                 else:  # Linux
                     subprocess.run(['xdg-open', folder_str], check=True)
             
-            logger.info(f"Opened output folder: {folder_path}")
+            logger.info("Opened output folder: %s", folder_path)
         except Exception as e:
-            logger.error(f"Failed to open output folder: {e}")
+            logger.error("Failed to open output folder: %s", e)
             messagebox.showerror(
                 "Error",
                 f"Could not open the output folder:\n{folder_path}\n\nError: {str(e)}"
@@ -2,15 +2,19 @@
 Common utility functions for document conversion.
 """
 
+import hashlib
 import logging
 import re
+from bisect import bisect_right
+from functools import lru_cache
+from unicodedata import normalize
 from pathlib import Path
-from slugify import slugify
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
 # Document formats supported by the converter
-SUPPORTED_FORMATS = {
+SUPPORTED_FORMATS = frozenset({
     # Documents
     ".pdf",
     ".doc",
@@ -46,9 +50,50 @@ SUPPORTED_FORMATS = {
     ".xml",
     # Archives
     ".zip",
-}
+})
+
+# Image formats recognised when extracting or copying embedded images
+IMAGE_FORMATS = frozenset({
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    ".bmp",
+    ".webp",
+    ".svg",
+    ".emf",
+    ".wmf",
+})
 
 
+def hash_file(path: Path, digest_size: int = 16) -> str:
+    """
+    Hash a file's contents with BLAKE2b through a fixed-size buffer.
+
+    Streams the file instead of loading it into memory, so hashing a
+    500 MB PDF costs the same ~1 MB of RAM as a small text file.
+
+    Args:
+        path: Path to the file to hash
+        digest_size: BLAKE2b digest size in bytes
+
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(path, "rb") as f:
+        try:
+            digest = hashlib.file_digest(
+                f, lambda: hashlib.blake2b(digest_size=digest_size)
+            )
+        except AttributeError:
+            # Python < 3.11: chunked update loop over a 1 MB buffer
+            digest = hashlib.blake2b(digest_size=digest_size)
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=4096)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename to be safe for all operating systems.
@@ -59,6 +104,14 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         A sanitized filename
     """
+    # Imported here so the CLI does not pay for slugify at startup; the
+    # lru_cache above means this resolves from sys.modules after first use
+    from slugify import slugify
+
+    # Normalize to NFC first so composed and decomposed forms of the same
+    # name sanitize identically
+    filename = normalize("NFC", filename)
+
     # Get the stem and extension separately
     path = Path(filename)
     # Handle paths with multiple segments
@@ -87,6 +140,7 @@ def sanitize_filename(filename: str) -> str:
     return f"{clean_stem}{suffix}"
 
 
+@lru_cache(maxsize=4096)
 def sanitize_title(title: str) -> str:
     """
     Sanitize a document title for use in navigation.
@@ -97,27 +151,17 @@ def sanitize_title(title: str) -> str:
     Returns:
         A sanitized title
     """
-    # Remove any file extensions
-    # First handle special characters and spacing
-    replacements = {
-        "–": "-",  # en dash
-        "—": "-",  # em dash
-        "™": "",  # trademark
-        "®": "",  # registered trademark
-        "©": "",  # copyright
-        "[": "(",  # brackets to parentheses
-        "]": ")",
-    }
+    # Normalize to NFC first so composed and decomposed forms of the same
+    # title compare and strip identically
+    title = normalize("NFC", title)
 
-    # Apply replacements
-    clean_title = title
-    for old, new in replacements.items():
-        clean_title = clean_title.replace(old, new)
+    # Handle special characters and spacing in a single translate pass
+    # instead of one allocation per replacement
+    clean_title = title.translate(_TITLE_TRANS)
 
-    # Remove other special characters but keep unicode letters/numbers
-    clean_title = "".join(
-        c for c in clean_title if c.isalnum() or c.isspace() or c in "()-.,"
-    )
+    # Remove other special characters but keep unicode letters/numbers -
+    # a compiled regex scan runs in C instead of a per-character loop
+    clean_title = _TITLE_STRIP_RE.sub("", clean_title)
 
     # Normalize spaces
     clean_title = " ".join(clean_title.split())
@@ -125,71 +169,154 @@ def sanitize_title(title: str) -> str:
     return clean_title.strip()
 
 
-def format_markdown(content: str) -> str:
+# Whitespace stripped from image names during normalization - a translate
+# table does this in one C-level pass with no regex machinery
+_WS_STRIP = dict.fromkeys(map(ord, " \t\n\r\f\v\xa0"), None)
+
+
+@lru_cache(maxsize=4096)
+def normalize_image_name(name: str) -> str:
+    """
+    Normalize an image reference for fuzzy matching.
+
+    Args:
+        name: Image filename or reference as it appears in the markdown
+
+    Returns:
+        The stem, lowercased with all whitespace removed
+    """
+    return Path(name).stem.translate(_WS_STRIP).lower()
+
+
+# Single-character title replacements, applied in one translate pass:
+# dashes normalized, legal marks dropped, brackets turned into parentheses
+_TITLE_TRANS = str.maketrans(
+    {
+        "–": "-",  # en dash
+        "—": "-",  # em dash
+        "™": "",  # trademark
+        "®": "",  # registered trademark
+        "©": "",  # copyright
+        "[": "(",  # brackets to parentheses
+        "]": ")",
+    }
+)
+
+# Characters stripped from titles: anything that is not a word character,
+# whitespace, or one of ()-.,  - plus underscore, which \w admits but
+# titles should not keep
+_TITLE_STRIP_RE = re.compile(r"[^\w\s().,\-]|_")
+
+# Problematic whitespace, fixed in one translate pass: vertical tabs become
+# spaces, form feeds and carriage returns disappear
+_WS_CLEAN_TRANS = str.maketrans({"\v": " ", "\f": "", "\r": ""})
+
+# Precompiled patterns for format_markdown - compiling once at import time
+# avoids repeated trips through the small re module cache on every document
+_IMAGE_REF_RE = re.compile(r"!\[(.*?)\]\((.*?)\)")
+_HEADING_SPACING_RE = re.compile(r"(#{1,6} .+?)(\n(?!#))")
+_BULLET_SPACING_RE = re.compile(r"(\n[*-] .+?)(\n[^*\n-])")
+_SECTION_SPACING_RE = re.compile(r"(\n\n[^#\n-].*?)(\n[^#\n-])")
+_URL_RE = re.compile(r"(?<![\[\(])(https?://[^\s\)\]]+)")
+_MD_LINK_RE = re.compile(r"!?\[[^\]]*\]\([^\)]*\)")
+_EXTRA_BLANKS_RE = re.compile(r"\n{3,}")
+
+# Structurally independent single-span rewrites - newlines in image alt
+# text, missing blank line after a table, slide markers - fused into one
+# alternation so the content is scanned once instead of once per fix. The
+# image alternative comes first so it wins overlapping matches, preserving
+# the order the fixes applied in when they were separate passes.
+_STRUCTURE_RE = re.compile(
+    r"(?P<img>!\[(?P<img_alt1>.*?)\n+(?P<img_alt2>.*?)\]\((?P<img_path>.*?)\))"
+    r"|(?P<table>(?P<table_row>\|[^\n]*\|)\s*\n(?!\|))"
+    r"|(?P<slide><!-- Slide number: (?P<slide_num>\d+) -->)"
+)
+
+
+def _structure_fix(m: "re.Match[str]") -> str:
+    """Dispatch a _STRUCTURE_RE match to the rewrite for its alternative."""
+    if m.group("img") is not None:
+        return f"![{m.group('img_alt1')} {m.group('img_alt2')}]({m.group('img_path')})"
+    if m.group("table") is not None:
+        return f"{m.group('table_row')}\n\n"
+    return f"\n---\n### Slide {m.group('slide_num')}\n"
+
+
+def format_markdown(content: str, image_map: Optional[Dict[str, str]] = None) -> str:
     """
     Format the Markdown content for better readability.
 
     Args:
         content: Original Markdown content
+        image_map: Optional mapping of original embedded image names to
+            their extracted paths relative to the markdown file
 
     Returns:
         Formatted Markdown content
     """
-    # Clean up vertical tabs and other problematic whitespace
-    content = content.replace("\v", " ")  # Replace vertical tabs with newlines
-    content = re.sub(r"[\f\r]", "", content)  # Remove form feeds and carriage returns
-
-    # Fix newlines in image alt text
-    content = re.sub(
-        r"!\[(.*?)\n+(.*?)\]\((.*?)\)",
-        lambda m: f"![{m.group(1)} {m.group(2)}]({m.group(3)})",
-        content,
-    )
-
-    # Ensure tables have newlines after them (only after the last row)
-    content = re.sub(r"(\|[^\n]*\|)\s*\n(?!\|)", r"\1\n\n", content)
-
-    # Format slide markers
-    content = re.sub(r"<!-- Slide number: (\d+) -->", r"\n---\n### Slide \1\n", content)
+    # Rewrite embedded image references to their extracted locations in a
+    # single pass. Every way a reference can spell a mapped image - full
+    # name, basename, bare stem, normalized form - is precomputed into one
+    # lookup table, so each reference resolves with O(1) dict probes
+    # instead of one content scan per variation.
+    if image_map:
+        lookup: Dict[str, str] = {}
+        for old_name, new_path in image_map.items():
+            old_path = Path(old_name)
+            lookup.setdefault(old_name, new_path)
+            lookup.setdefault(old_path.name, new_path)
+            lookup.setdefault(old_path.stem, new_path)
+            lookup.setdefault(normalize_image_name(old_name), new_path)
+        mapped_paths = set(image_map.values())
+
+        def _image_ref(m: "re.Match[str]") -> str:
+            ref = m.group(2)
+            if ref in mapped_paths:
+                return m.group(0)
+            new_path = (
+                lookup.get(ref)
+                or lookup.get(Path(ref).name)
+                or lookup.get(normalize_image_name(ref))
+            )
+            if new_path is None:
+                return m.group(0)
+            return f"![{m.group(1)}]({new_path})"
+
+        content = _IMAGE_REF_RE.sub(_image_ref, content)
+
+    # Clean up vertical tabs and other problematic whitespace in one pass
+    content = content.translate(_WS_CLEAN_TRANS)
+
+    # Fix newlines in image alt text, ensure tables have a blank line after
+    # their last row, and format slide markers - one fused scan
+    content = _STRUCTURE_RE.sub(_structure_fix, content)
 
     # Add proper spacing around headings
-    content = re.sub(r"(#{1,6} .+?)(\n(?!#))", r"\1\n\2", content)
+    content = _HEADING_SPACING_RE.sub(r"\1\n\2", content)
 
     # Add proper spacing around bullet points
-    content = re.sub(r"(\n[*-] .+?)(\n[^*\n-])", r"\1\n\2", content)
+    content = _BULLET_SPACING_RE.sub(r"\1\n\2", content)
 
     # Add proper spacing around sections
-    content = re.sub(r"(\n\n[^#\n-].*?)(\n[^#\n-])", r"\1\n\2", content)
-
-    # Detect and format URLs that aren't already markdown links
-    # First, exclude URLs that are already part of markdown links or images
-    def is_in_markdown_link(match, text):
-        # Check if the URL is already part of a markdown link
-        start = max(0, match.start() - 50)  # Look at the 50 chars before the match
-        end = min(len(text), match.end() + 50)  # Look at the 50 chars after the match
-        context = text[start:end]
-
-        # If there's a closing bracket before the URL and an opening bracket after,
-        # it's likely already in a markdown link
-        before = context[: match.start() - start]
-        after = context[match.end() - start :]
-        return "](" in before and ")" in after
-
-    # URL regex pattern
-    url_pattern = r"(?<![\[\(])(https?://[^\s\)\]]+)"
-
-    # Find all URLs and replace them with markdown links if they're not already links
-    content = re.sub(
-        url_pattern,
-        lambda m: (
-            m.group(0)
-            if is_in_markdown_link(m, content)
-            else f"[{m.group(0)}]({m.group(0)})"
-        ),
-        content,
-    )
+    content = _SECTION_SPACING_RE.sub(r"\1\n\2", content)
+
+    # Detect and format URLs that aren't already markdown links. One
+    # pre-pass records the span of every existing link or image, so each
+    # candidate URL is checked against those spans with a bisect instead of
+    # re-scanning a window of surrounding text per URL.
+    link_spans = [(m.start(), m.end()) for m in _MD_LINK_RE.finditer(content)]
+    link_starts = [start for start, _ in link_spans]
+
+    def _linkify(m: "re.Match[str]") -> str:
+        index = bisect_right(link_starts, m.start()) - 1
+        if index >= 0 and m.start() < link_spans[index][1]:
+            # Already inside a markdown link or image
+            return m.group(0)
+        return f"[{m.group(0)}]({m.group(0)})"
+
+    content = _URL_RE.sub(_linkify, content)
 
     # Remove extra blank lines
-    content = re.sub(r"\n{3,}", r"\n\n", content)
+    content = _EXTRA_BLANKS_RE.sub(r"\n\n", content)
 
     return content
@@ -1,9 +1,18 @@
 """
 Tests for document conversion functionality.
 """
+import shutil
+import zipfile
+
 import pytest
 from pathlib import Path
-from docs_to_site.document_converter import DocumentConverter
+from docs_to_site.document_converter import (
+    DocumentConverter,
+    _content_hash,
+    convert_single_document,
+    copy_embedded_images,
+    extract_pptx_images,
+)
 from docs_to_site.processors.general_processor import GeneralProcessor
 from docs_to_site.utils import SUPPORTED_FORMATS
 
@@ -91,4 +100,120 @@ More content"""
     assert "\r" not in formatted  # No carriage returns
     
     # Check that consecutive newlines are normalized
-    assert "\n\n\n" not in formatted 
\ No newline at end of file
+    assert "\n\n\n" not in formatted 
+
+def test_extract_pptx_images(temp_dirs):
+    """Test that embedded images are extracted from a PPTX archive."""
+    input_dir, output_dir = temp_dirs
+
+    # Build a minimal .pptx (which is just a ZIP) with two media entries
+    pptx_path = input_dir / "deck.pptx"
+    with zipfile.ZipFile(pptx_path, "w") as archive:
+        archive.writestr("ppt/media/image1.png", b"png-bytes")
+        archive.writestr("ppt/media/image2.jpeg", b"jpeg-bytes")
+        archive.writestr("ppt/slides/slide1.xml", b"<xml/>")
+
+    images_dir = output_dir / "docs" / "images" / "deck"
+    image_map = extract_pptx_images(pptx_path, images_dir)
+
+    assert image_map == {"image1.png": "image_1.png", "image2.jpeg": "image_2.jpeg"}
+    assert (images_dir / "image_1.png").read_bytes() == b"png-bytes"
+    assert (images_dir / "image_2.jpeg").read_bytes() == b"jpeg-bytes"
+
+
+def test_extract_pptx_images_deduplicates(temp_dirs):
+    """Test that byte-identical media entries are extracted only once."""
+    input_dir, output_dir = temp_dirs
+
+    pptx_path = input_dir / "deck.pptx"
+    with zipfile.ZipFile(pptx_path, "w") as archive:
+        archive.writestr("ppt/media/image1.png", b"same-bytes")
+        archive.writestr("ppt/media/image2.png", b"same-bytes")
+        archive.writestr("ppt/media/image3.png", b"different")
+
+    images_dir = output_dir / "docs" / "images" / "deck"
+    image_map = extract_pptx_images(pptx_path, images_dir)
+
+    # Both duplicate names resolve to the same extracted file
+    assert image_map == {
+        "image1.png": "image_1.png",
+        "image2.png": "image_1.png",
+        "image3.png": "image_2.png",
+    }
+    assert sorted(p.name for p in images_dir.iterdir()) == [
+        "image_1.png",
+        "image_2.png",
+    ]
+
+
+def test_extract_pptx_images_no_media(temp_dirs):
+    """Test that a presentation without media produces no images directory."""
+    input_dir, output_dir = temp_dirs
+
+    pptx_path = input_dir / "empty.pptx"
+    with zipfile.ZipFile(pptx_path, "w") as archive:
+        archive.writestr("ppt/slides/slide1.xml", b"<xml/>")
+
+    images_dir = output_dir / "docs" / "images" / "empty"
+    image_map = extract_pptx_images(pptx_path, images_dir)
+
+    assert image_map == {}
+    assert not images_dir.exists()
+
+
+def test_content_hash_varies_by_name_and_directory(temp_dirs):
+    """Test that identical bytes under other names or directories miss the cache."""
+    input_dir, _ = temp_dirs
+    (input_dir / "sub").mkdir()
+    first = input_dir / "a.txt"
+    renamed = input_dir / "b.txt"
+    moved = input_dir / "sub" / "a.txt"
+    for path in (first, renamed, moved):
+        path.write_text("same bytes")
+
+    def key(path):
+        return _content_hash(path, path.relative_to(input_dir).parent)
+
+    assert key(first) == key(first)
+    assert key(first) != key(renamed)
+    assert key(first) != key(moved)
+
+
+def test_cache_hit_restores_page_and_sibling_images(temp_dirs):
+    """Test that rebuilding from cache re-runs the image side effects."""
+    input_dir, output_dir = temp_dirs
+    docs_dir = output_dir / "docs"
+
+    (input_dir / "pic.png").write_bytes(b"png-bytes")
+    page = input_dir / "page.html"
+    page.write_text('<html><body><p>Text</p><img src="pic.png"/></body></html>')
+
+    relative_output, title = convert_single_document(page, input_dir, docs_dir)
+    assert (docs_dir / "pic.png").read_bytes() == b"png-bytes"
+
+    # Wipe the docs tree but keep the cache; the rebuild must restore both
+    # the page and the image it references
+    shutil.rmtree(docs_dir)
+    assert (output_dir / ".d2s-cache").is_dir()
+    cached_output, cached_title = convert_single_document(page, input_dir, docs_dir)
+
+    assert (cached_output, cached_title) == (relative_output, title)
+    assert (docs_dir / relative_output).is_file()
+    assert (docs_dir / "pic.png").read_bytes() == b"png-bytes"
+
+
+def test_copy_embedded_images(temp_dirs):
+    """Test that referenced sibling images follow the markdown output."""
+    input_dir, output_dir = temp_dirs
+    docs_dir = output_dir / "docs"
+
+    (input_dir / "photo.png").write_bytes(b"png-bytes")
+    (input_dir / "unreferenced.png").write_bytes(b"other")
+    (input_dir / "notes.txt").write_text("not an image")
+
+    content = "Some text with ![Photo](photo.png) inline"
+    copied = copy_embedded_images(input_dir, docs_dir, content)
+
+    assert copied == 1
+    assert (docs_dir / "photo.png").read_bytes() == b"png-bytes"
+    assert not (docs_dir / "unreferenced.png").exists()
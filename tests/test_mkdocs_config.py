@@ -71,6 +71,36 @@ def test_custom_mkdocs_config(temp_dirs, config_content):
     assert final_config["site_name"] == config_content["site_name"]
 
 
+def test_nav_group_survives_matching_direct_title(temp_dirs):
+    """Test that a title equal to a group's prefix never clobbers the group."""
+    output_dir, docs_dir = temp_dirs
+
+    config = MkDocsConfig(output_dir, docs_dir)
+    # Group first and group last - the group must win in both orders
+    first = {
+        Path("doc1.md"): "Client - Guide",
+        Path("doc2.md"): "Client",
+    }
+    last = {
+        Path("doc2.md"): "Client",
+        Path("doc1.md"): "Client - Guide",
+    }
+    for converted_files in (first, last):
+        nav = config._build_nav_structure(converted_files)
+        client_section = next(item for item in nav if "Client" in item)
+        assert client_section["Client"] == [{"Guide": "doc1.md"}]
+
+
+def test_nav_empty_prefix_is_a_direct_entry(temp_dirs):
+    """Test that a title starting with the separator does not create a '' group."""
+    output_dir, docs_dir = temp_dirs
+
+    config = MkDocsConfig(output_dir, docs_dir)
+    nav = config._build_nav_structure({Path("doc1.md"): " - Foo"})
+
+    assert nav == [{"- Foo": "doc1.md"}]
+
+
 def test_nav_structure_with_special_characters(temp_dirs):
     """Test navigation structure with special characters."""
     output_dir, docs_dir = temp_dirs
@@ -2,7 +2,13 @@
 Tests for utility functions.
 """
 import pytest
-from docs_to_site.utils import sanitize_title, sanitize_filename, SUPPORTED_FORMATS
+from docs_to_site.utils import (
+    format_markdown,
+    normalize_image_name,
+    sanitize_title,
+    sanitize_filename,
+    SUPPORTED_FORMATS,
+)
 
 
 def test_supported_formats():
@@ -63,4 +69,23 @@ def test_windows_1252_encoding():
     # This is a Windows-1252 encoded string with special characters
     win1252_text = b'Client Flyer \x96 Build watsonx.ai'.decode('cp1252')
     sanitized = sanitize_title(win1252_text)
-    assert sanitized == "Client Flyer - Build watsonx.ai" 
\ No newline at end of file
+    assert sanitized == "Client Flyer - Build watsonx.ai" 
+
+def test_normalize_image_name():
+    """Test image name normalization for fuzzy matching."""
+    assert normalize_image_name("Picture 4.jpg") == "picture4"
+    assert normalize_image_name("image1.png") == "image1"
+    assert normalize_image_name("My\tImage .PNG") == "myimage"
+
+
+def test_format_markdown_image_map():
+    """Test that image references are rewritten via the image map."""
+    content = "![Alt](image1.png) and ![Other](Image 2.png)"
+    image_map = {
+        "image1.png": "images/doc/image_1.png",
+        "image2.png": "images/doc/image_2.png",
+    }
+    formatted = format_markdown(content, image_map=image_map)
+    # Exact match rewritten directly; second resolves via normalized lookup
+    assert "![Alt](images/doc/image_1.png)" in formatted
+    assert "![Other](images/doc/image_2.png)" in formatted